@@ -40,6 +40,14 @@ void Envelope::setRelease(float seconds) {
     calculateRates();
 }
 
+void Envelope::setADSR(float attack, float decay, float sustain, float release) {
+    attackTime = std::max(0.001f, attack);
+    decayTime = std::max(0.001f, decay);
+    sustainLevel = std::clamp(sustain, 0.0f, 1.0f);
+    releaseTime = std::max(0.001f, release);
+    calculateRates();
+}
+
 void Envelope::setAttackBend(float bend) {
     attackBend = std::clamp(bend, 0.0f, 1.0f);
 }
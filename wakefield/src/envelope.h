@@ -18,6 +18,7 @@ public:
     void setDecay(float seconds);
     void setSustain(float level);     // 0.0 to 1.0
     void setRelease(float seconds);
+    void setADSR(float attack, float decay, float sustain, float release);  // Recalculates rates once
 
     // Set envelope bend/curve parameters (0.0-1.0, where 0.5 = linear)
     void setAttackBend(float bend);   // <0.5 = concave, >0.5 = convex
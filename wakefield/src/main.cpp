@@ -4,8 +4,11 @@
 #include <fstream>
 #include <csignal>
 #include <unistd.h>
+#include <poll.h>
 #include <locale.h>
 #include <cmath>
+#include <chrono>
+#include <algorithm>
 #include <sys/stat.h>
 #include <pwd.h>
 #include "synth.h"
@@ -26,6 +29,7 @@ LoopManager* loopManager = nullptr;  // Non-static so UI can access it
 Sequencer* sequencer = nullptr;  // Non-static so UI can access it
 static Clock* transportClock = nullptr;
 static bool running = true;
+static bool debugXruns = false;  // Set from WAKEFIELD_DEBUG at startup
 
 void signalHandler(int signum) {
     running = false;
@@ -351,6 +355,8 @@ int audioCallback(void* outputBuffer, void* /*inputBuffer*/,
     static std::vector<float> tempBuffer;
     static std::vector<float> tempL;
     static std::vector<float> tempR;
+    static std::vector<float> outL;
+    static std::vector<float> outR;
 
     // Parameter smoothers (10ms smoothing time at 48kHz = ~100Hz update rate)
     static bool smoothersInitialized = false;
@@ -379,7 +385,9 @@ int audioCallback(void* outputBuffer, void* /*inputBuffer*/,
 
     float* buffer = static_cast<float*>(outputBuffer);
 
-    if (status) {
+    // Console I/O in the audio thread stalls the callback and scribbles over
+    // the curses screen, so only report xruns when debugging
+    if (status && debugXruns) {
         std::cout << "Stream underflow detected!" << std::endl;
     }
 
@@ -573,6 +581,8 @@ int audioCallback(void* outputBuffer, void* /*inputBuffer*/,
             tempBuffer.resize(stereoFrames);
             tempL.resize(nFrames);
             tempR.resize(nFrames);
+            outL.resize(nFrames);
+            outR.resize(nFrames);
         }
 
         // Process synth into temp buffer
@@ -585,8 +595,6 @@ int audioCallback(void* outputBuffer, void* /*inputBuffer*/,
         }
         
         // Process through loopers (post-effects)
-        std::vector<float> outL(nFrames);
-        std::vector<float> outR(nFrames);
         loopManager->processBlock(tempL.data(), tempR.data(), outL.data(), outR.data(), nFrames);
         
         // Interleave output
@@ -606,6 +614,7 @@ int main(int argc, char** argv) {
     setlocale(LC_ALL, "");
     // Set up signal handler for Ctrl+C
     signal(SIGINT, signalHandler);
+    debugXruns = getenv("WAKEFIELD_DEBUG") != nullptr;
     
     // Create synth parameters
     synthParams = new SynthParameters();
@@ -786,6 +795,10 @@ int main(int argc, char** argv) {
     
     // Main UI loop
     float deltaTime = 0.05f;  // 50ms default (20 FPS)
+    const auto framePeriod = std::chrono::milliseconds(50);  // Live meters/scopes refresh (~20 FPS)
+    const auto minFrameInterval = std::chrono::microseconds(16667);  // Input-driven redraw cap (60 FPS)
+    auto nextFrameTime = std::chrono::steady_clock::now();
+    auto earliestRedrawTime = nextFrameTime;
     while (running) {
         // Update UI and handle input
         if (!ui->update()) {
@@ -823,12 +836,26 @@ int main(int argc, char** argv) {
         
         // Oscilloscopes removed for simplified UI
         
-        // Draw UI
-        int activeVoices = synth->getActiveVoiceCount();
-        ui->draw(activeVoices);
+        // Draw UI only when input changed something or the periodic frame is due.
+        // Input-driven redraws are capped at 60 FPS so key repeat can't outpace the terminal.
+        auto now = std::chrono::steady_clock::now();
+        if ((ui->needsRedraw() && now >= earliestRedrawTime) || now >= nextFrameTime) {
+            int activeVoices = synth->getActiveVoiceCount();
+            ui->draw(activeVoices);
+            nextFrameTime = now + framePeriod;
+            earliestRedrawTime = now + minFrameInterval;
+        }
         
-        // Sleep to control refresh rate (~20 FPS)
-        usleep(50000);  // 50ms
+        // Wait for the next keypress or frame (~20 FPS), whichever comes first.
+        // Waking on stdin readiness means keys are handled immediately instead of
+        // waiting out a fixed sleep. MIDI is drained by the audio callback, so it
+        // does not need to wake this loop. A redraw held back by the 60 FPS cap
+        // shortens the wait so it is flushed as soon as the cap allows.
+        auto wakeTime = ui->needsRedraw() ? std::min(earliestRedrawTime, nextFrameTime) : nextFrameTime;
+        auto waitMs = std::chrono::ceil<std::chrono::milliseconds>(
+            wakeTime - std::chrono::steady_clock::now()).count();
+        struct pollfd stdinPoll = {STDIN_FILENO, POLLIN, 0};
+        poll(&stdinPoll, 1, static_cast<int>(std::max<long long>(0, waitMs)));
     }
     
     // Clean shutdown
@@ -8,6 +8,8 @@
 void* MidiHandler::uiPointer = nullptr;
 
 MidiHandler::MidiHandler() : midiIn(nullptr), currentPort(-1) {
+    // Reserve up front so draining messages never allocates on the audio thread
+    messageBuffer.reserve(256);
 }
 
 MidiHandler::~MidiHandler() {
@@ -69,7 +71,7 @@ void MidiHandler::setUI(void* uiPtr) {
 bool MidiHandler::initialize() {
     try {
         // Create RtMidiIn with error callback to suppress messages
-        midiIn = new RtMidiIn(RtMidi::UNSPECIFIED, "WakefieldSynth", 100);
+        midiIn = new RtMidiIn(RtMidi::UNSPECIFIED, "WakefieldSynth", MIDI_INPUT_QUEUE_SIZE);
         
         // Set error callback to suppress error messages
         midiIn->setErrorCallback(&MidiHandler::midiErrorCallback, nullptr);
@@ -182,18 +184,18 @@ void MidiHandler::processMessages(void (*noteOnCallback)(int note, int velocity)
                                  void (*ccCallback)(int controller, int value)) {
     if (!midiIn) return;
     
-    std::vector<unsigned char> message;
-    double stamp;
-    
-    // Process all pending MIDI messages
+    // Drain every pending MIDI message into the reused buffer. Messages are
+    // dispatched in order and never merged: looper CCs are edge-triggered
+    // (press/release) and short notes must still sound, so dropping an
+    // on/off pair would change what gets played.
     while (true) {
-        stamp = midiIn->getMessage(&message);
+        midiIn->getMessage(&messageBuffer);
         
-        if (message.empty()) {
+        if (messageBuffer.empty()) {
             break;  // No more messages
         }
         
-        parseMessage(message, noteOnCallback, noteOffCallback, ccCallback);
+        parseMessage(messageBuffer, noteOnCallback, noteOffCallback, ccCallback);
     }
 }
 
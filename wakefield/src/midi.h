@@ -10,6 +10,11 @@ constexpr unsigned char MIDI_NOTE_OFF = 0x80;
 constexpr unsigned char MIDI_NOTE_ON = 0x90;
 constexpr unsigned char MIDI_CONTROL_CHANGE = 0xB0;
 
+// RtMidi input queue depth (messages). The queue is drained once per audio
+// buffer, so it must absorb a full burst (chords, fast CC sweeps) between
+// callbacks; RtMidi silently drops messages once the queue is full.
+constexpr unsigned int MIDI_INPUT_QUEUE_SIZE = 1024;
+
 // MIDI helper functions
 class MidiHandler {
 public:
@@ -25,7 +30,10 @@ public:
     // Open a specific port (or default)
     bool openPort(unsigned int portNumber = 1);
     
-    // Get pending messages (call this from audio thread)
+    // Get pending messages (call this from audio thread). RtMidi's backend
+    // thread fills the input queue as events arrive, and the audio callback
+    // drains it every buffer, so MIDI timing never depends on the UI loop
+    // or on how long a curses redraw takes.
     void processMessages(void (*noteOnCallback)(int note, int velocity),
                         void (*noteOffCallback)(int note),
                         void (*ccCallback)(int controller, int value) = nullptr);
@@ -47,6 +55,7 @@ public:
 private:
     int currentPort;
     RtMidiIn* midiIn;
+    std::vector<unsigned char> messageBuffer;  // Reused by processMessages (audio thread)
     static void* uiPointer;  // Static pointer to UI for error callback
     
     // Parse a MIDI message
@@ -2,8 +2,23 @@
 #include "clock.h"
 #include "ui.h"
 #include <algorithm>
+#include <array>
 #include <iostream>
 
+namespace {
+
+// Equal-tempered frequencies for every MIDI note, built once at startup so
+// noteOn() doesn't call std::pow on the audio thread
+const std::array<float, 128> kMidiNoteFrequencies = [] {
+    std::array<float, 128> table{};
+    for (int note = 0; note < 128; ++note) {
+        table[note] = 440.0f * std::pow(2.0f, (note - 69) / 12.0f);
+    }
+    return table;
+}();
+
+} // namespace
+
 Synth::Synth(float sampleRate)
     : sampleRate(sampleRate)
     , masterVolume(0.5f)
@@ -44,6 +59,9 @@ Synth::Synth(float sampleRate)
 float Synth::midiNoteToFrequency(int midiNote) {
     // MIDI note 69 = A4 = 440 Hz
     // Formula: f = 440 * 2^((n-69)/12)
+    if (midiNote >= 0 && midiNote < 128) {
+        return kMidiNoteFrequencies[midiNote];
+    }
     return 440.0f * std::pow(2.0f, (midiNote - 69) / 12.0f);
 }
 
@@ -62,10 +80,7 @@ int Synth::findFreeVoice() {
 void Synth::updateEnvelopeParameters(float attack, float decay, float sustain, float release) {
     // Update all voice envelopes with new parameters
     for (auto& voice : voices) {
-        voice.envelope.setAttack(attack);
-        voice.envelope.setDecay(decay);
-        voice.envelope.setSustain(sustain);
-        voice.envelope.setRelease(release);
+        voice.envelope.setADSR(attack, decay, sustain, release);
     }
 }
 
@@ -198,20 +213,14 @@ void Synth::noteOff(int midiNote) {
 }
 
 int Synth::getActiveVoiceCount() const {
-    int count = 0;
-    for (int i = 0; i < MAX_VOICES; ++i) {
-        if (voices[i].active) {
-            count++;
-        }
-    }
-    return count;
+    return __builtin_popcount(activeVoiceMask.load(std::memory_order_relaxed));
 }
 
 bool Synth::isVoiceActive(int voiceIndex) const {
     if (voiceIndex < 0 || voiceIndex >= MAX_VOICES) {
         return false;
     }
-    return voices[voiceIndex].active;
+    return (activeVoiceMask.load(std::memory_order_relaxed) >> voiceIndex) & 1u;
 }
 
 float Synth::getVoiceEnvelopeValue(int voiceIndex) const {
@@ -437,25 +446,37 @@ void Synth::process(float* output, unsigned int nFrames, unsigned int nChannels)
         }
     }
     
+    // Publish which voices are sounding so the UI can read them without
+    // touching the voice objects the audio thread owns
+    uint32_t mask = 0;
+    for (int v = 0; v < MAX_VOICES; ++v) {
+        if (voices[v].active) {
+            mask |= 1u << v;
+        }
+    }
+    activeVoiceMask.store(mask, std::memory_order_relaxed);
+
     // Apply reverb if enabled (stereo processing)
     if (reverbEnabled && nChannels == 2) {
-        // Create temporary buffers for left and right channels
-        std::vector<float> leftChannel(nFrames);
-        std::vector<float> rightChannel(nFrames);
+        // Ensure scratch buffers are large enough (only reallocates if the block size grows)
+        if (nFrames > reverbBufferL.size()) {
+            reverbBufferL.resize(nFrames);
+            reverbBufferR.resize(nFrames);
+        }
         
         // De-interleave
         for (unsigned int i = 0; i < nFrames; ++i) {
-            leftChannel[i] = output[i * 2];
-            rightChannel[i] = output[i * 2 + 1];
+            reverbBufferL[i] = output[i * 2];
+            reverbBufferR[i] = output[i * 2 + 1];
         }
         
         // Process reverb
-        reverb.process(leftChannel.data(), rightChannel.data(), nFrames);
+        reverb.process(reverbBufferL.data(), reverbBufferR.data(), nFrames);
         
         // Re-interleave
         for (unsigned int i = 0; i < nFrames; ++i) {
-            output[i * 2] = leftChannel[i];
-            output[i * 2 + 1] = rightChannel[i];
+            output[i * 2] = reverbBufferL[i];
+            output[i * 2 + 1] = reverbBufferR[i];
         }
     }
 }
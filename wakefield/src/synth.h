@@ -1,7 +1,9 @@
 #ifndef SYNTH_H
 #define SYNTH_H
 
+#include <atomic>
 #include <cmath>
+#include <cstdint>
 #include <vector>
 #include "voice.h"
 #include "brainwave_osc.h"
@@ -222,6 +224,10 @@ private:
     Clock* clock;
 
     std::vector<Voice> voices;
+    std::vector<float> reverbBufferL;  // De-interleaved reverb scratch, grown on demand
+    std::vector<float> reverbBufferR;
+    std::atomic<uint32_t> activeVoiceMask{0};  // Bit per active voice, published once per buffer for the UI
+    static_assert(MAX_VOICES <= 32, "activeVoiceMask holds one bit per voice");
     GreyholeReverb reverb;
 
     // 4 global LFOs for modulation
@@ -6,6 +6,8 @@
 #include <string>
 #include <atomic>
 #include <vector>
+#include <bitset>
+#include <unordered_map>
 #include <functional>
 #include "oscillator.h"
 #include "cpu_monitor.h"
@@ -867,6 +869,9 @@ enum class UIPage {
     CONFIG
 };
 
+// Number of UI pages; tab order follows the UIPage declaration order
+constexpr int UI_PAGE_COUNT = static_cast<int>(UIPage::CONFIG) + 1;
+
 class UI {
 public:
     UI(Synth* synth, SynthParameters* params);
@@ -882,6 +887,10 @@ public:
     // Draw the UI
     void draw(int activeVoices);
 
+    // Redraw request (set when input changes UI state, cleared by draw)
+    bool needsRedraw() const { return redrawRequested; }
+    void requestRedraw() { redrawRequested = true; }
+
     // Sequencer info field identifiers (exposed for shared lookup tables)
     enum class SequencerInfoField {
         TEMPO = 0,
@@ -937,6 +946,7 @@ private:
     Synth* synth;
     SynthParameters* params;
     bool initialized;
+    bool redrawRequested;
     UIPage currentPage;
     
     // Device information
@@ -981,6 +991,7 @@ private:
     // Help system
     bool helpActive;
     int helpScrollOffset;
+    std::vector<std::string> helpLines;  // Help text for the open page, split once in showHelp()
     void showHelp();
     void hideHelp();
     void drawHelpPage();
@@ -988,7 +999,7 @@ private:
 
     // MIDI keyboard mode
     bool midiKeyboardMode;
-    std::vector<int> activeKeyboardNotes;  // Track which notes are currently pressed
+    std::bitset<128> activeKeyboardNotes;  // Track which MIDI notes are currently pressed
     int getCurrentOctave() const { return midiKeyboardOctave; }
     void setCurrentOctave(int octave) { midiKeyboardOctave = octave; }
 
@@ -997,6 +1008,9 @@ private:
 
     // CPU monitor
     CPUMonitor cpuMonitor;
+    float cpuOverlayUsage = -1.0f;  // Usage last formatted into cpuOverlayText
+    char cpuOverlayText[16] = "";
+    int cpuOverlayColorPair = 2;
     void drawCPUOverlay();
 
     // Text input for preset names
@@ -1056,9 +1070,11 @@ private:
     
     // Parameter management
     std::vector<InlineParameter> parameters;
+    std::unordered_map<int, size_t> parameterIndexById;  // Built once by initializeParameters()
+    std::vector<std::vector<int>> parameterIdsByPage;    // Indexed by UIPage, in definition order
     void initializeParameters();
     InlineParameter* getParameter(int id);
-    std::vector<int> getParameterIdsForPage(UIPage page);
+    const std::vector<int>& getParameterIdsForPage(UIPage page) const;
     void adjustParameter(int id, bool increase, bool fine);
     void setParameterValue(int id, float value);
     float getParameterValue(int id);
@@ -3,13 +3,36 @@
 #include <algorithm>
 #include <cmath>
 #include <vector>
-#include <deque>
+#include <utility>
 
 // Trajectory history buffer for visualization
 namespace {
     // Store recent (x, y) points for each chaos generator
     const int TRAJECTORY_HISTORY_SIZE = 300;
-    std::deque<std::pair<float, float>> trajectoryHistory[4];
+
+    // Fixed-capacity ring: once full, each new point overwrites the oldest
+    // in place, so pushing and reading in age order never allocates.
+    struct TrajectoryHistory {
+        std::pair<float, float> points[TRAJECTORY_HISTORY_SIZE];
+        int head = 0;   // Index of the oldest point
+        int count = 0;
+
+        void push(float x, float y) {
+            points[(head + count) % TRAJECTORY_HISTORY_SIZE] = {x, y};
+            if (count < TRAJECTORY_HISTORY_SIZE) {
+                ++count;
+            } else {
+                head = (head + 1) % TRAJECTORY_HISTORY_SIZE;
+            }
+        }
+
+        // Index 0 is the oldest point, count - 1 the most recent
+        const std::pair<float, float>& at(int i) const {
+            return points[(head + i) % TRAJECTORY_HISTORY_SIZE];
+        }
+    };
+
+    TrajectoryHistory trajectoryHistory[4];
 }
 
 void UI::drawChaosVisualization(int topRow, int leftCol, int plotHeight, int plotWidth, int chaosIndex) {
@@ -47,10 +70,7 @@ void UI::drawChaosVisualization(int topRow, int leftCol, int plotHeight, int plo
 
     // Update trajectory history
     if (running && chaosIndex >= 0 && chaosIndex < 4) {
-        trajectoryHistory[chaosIndex].push_back({currentX, currentY});
-        if (trajectoryHistory[chaosIndex].size() > TRAJECTORY_HISTORY_SIZE) {
-            trajectoryHistory[chaosIndex].pop_front();
-        }
+        trajectoryHistory[chaosIndex].push(currentX, currentY);
     }
 
     // Create visualization grid
@@ -62,12 +82,14 @@ void UI::drawChaosVisualization(int topRow, int leftCol, int plotHeight, int plo
     const float viewMinY = -2.0f;
     const float viewMaxY = 2.0f;
 
+    // World units to grid cells, computed once so each point is a multiply, not a divide
+    const float scaleX = (width - 1) / (viewMaxX - viewMinX);
+    const float scaleY = (height - 1) / (viewMaxY - viewMinY);
+
     // Helper to map world coordinates to grid coordinates
     auto worldToGrid = [&](float x, float y, int& gx, int& gy) {
-        float normX = (x - viewMinX) / (viewMaxX - viewMinX);
-        float normY = (y - viewMinY) / (viewMaxY - viewMinY);
-        gx = static_cast<int>(normX * (width - 1));
-        gy = static_cast<int>((1.0f - normY) * (height - 1));  // Flip Y for screen coords
+        gx = static_cast<int>((x - viewMinX) * scaleX);
+        gy = static_cast<int>((viewMaxY - y) * scaleY);  // Flip Y for screen coords
         gx = std::min(std::max(gx, 0), width - 1);
         gy = std::min(std::max(gy, 0), height - 1);
     };
@@ -81,16 +103,20 @@ void UI::drawChaosVisualization(int topRow, int leftCol, int plotHeight, int plo
 
     // Draw trajectory history
     if (chaosIndex >= 0 && chaosIndex < 4) {
-        for (size_t i = 0; i < trajectoryHistory[chaosIndex].size(); ++i) {
-            auto& point = trajectoryHistory[chaosIndex][i];
+        const TrajectoryHistory& history = trajectoryHistory[chaosIndex];
+        // Age bands (oldest third, middle third, newest third) as index thresholds
+        const int oldPointsEnd = history.count / 3;
+        const int midPointsEnd = 2 * history.count / 3;
+        for (int i = 0; i < history.count; ++i) {
+            const auto& point = history.at(i);
             int gx, gy;
             worldToGrid(point.first, point.second, gx, gy);
 
             if (gx >= 0 && gx < width && gy >= 0 && gy < height) {
                 // Use different characters for recent vs old points
-                if (i < trajectoryHistory[chaosIndex].size() / 3) {
+                if (i < oldPointsEnd) {
                     grid[gy][gx] = '.';  // Older points
-                } else if (i < 2 * trajectoryHistory[chaosIndex].size() / 3) {
+                } else if (i < midPointsEnd) {
                     grid[gy][gx] = 'o';  // Mid-age points
                 } else {
                     grid[gy][gx] = '*';  // Recent points
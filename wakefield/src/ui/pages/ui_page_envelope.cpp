@@ -218,19 +218,19 @@ void UI::drawEnvelopePage() {
         // Draw bar (20 chars wide)
         int barWidth = 20;
         int barStart = voiceMeterCol + 9;
-        int filledWidth = static_cast<int>(envValue * barWidth);
+        int filledWidth = active ? std::clamp(static_cast<int>(envValue * barWidth), 0, barWidth) : 0;
 
+        // Filled and empty parts are each one run, so draw them with one write apiece
         mvprintw(voiceMeterRow, barStart, "[");
-        for (int i = 0; i < barWidth; ++i) {
-            if (i < filledWidth && active) {
-                attron(COLOR_PAIR(2));
-                mvaddch(voiceMeterRow, barStart + 1 + i, '=');
-                attroff(COLOR_PAIR(2));
-            } else {
-                attron(COLOR_PAIR(8));
-                mvaddch(voiceMeterRow, barStart + 1 + i, '-');
-                attroff(COLOR_PAIR(8));
-            }
+        if (filledWidth > 0) {
+            attron(COLOR_PAIR(2));
+            mvhline(voiceMeterRow, barStart + 1, '=', filledWidth);
+            attroff(COLOR_PAIR(2));
+        }
+        if (filledWidth < barWidth) {
+            attron(COLOR_PAIR(8));
+            mvhline(voiceMeterRow, barStart + 1 + filledWidth, '-', barWidth - filledWidth);
+            attroff(COLOR_PAIR(8));
         }
         mvprintw(voiceMeterRow, barStart + barWidth + 1, "]");
 
@@ -18,7 +18,7 @@ void UI::drawMixerPage() {
     attroff(COLOR_PAIR(3));
 
     // Get parameter IDs for this page
-    std::vector<int> pageParams = getParameterIdsForPage(UIPage::MIXER);
+    const std::vector<int>& pageParams = getParameterIdsForPage(UIPage::MIXER);
 
     // Draw oscillators (IDs 50-53)
     for (int i = 0; i < 4; ++i) {
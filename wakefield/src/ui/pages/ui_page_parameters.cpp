@@ -5,7 +5,7 @@
 void UI::drawParametersPage(int startRow, int startCol) {
     int row = startRow;
     int col = startCol;
-    std::vector<int> pageParams = getParameterIdsForPage(currentPage);
+    const std::vector<int>& pageParams = getParameterIdsForPage(currentPage);
 
     // Draw parameters inline with left/right control indicators
     for (int paramId : pageParams) {
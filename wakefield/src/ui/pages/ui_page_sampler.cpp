@@ -9,25 +9,34 @@
 
 namespace {
 
-void drawSamplerWaveform(int topRow, int leftCol, int height, int width, const SampleData* sample, float loopStart, float loopLength) {
-    if (!sample || sample->sampleCount == 0 || !sample->samples) return;
-
-    // Calculate how many samples to analyze per column
-    const int samplesPerColumn = sample->sampleCount / width;
-    if (samplesPerColumn == 0) return;
-
-    int centerRow = topRow + height / 2;
+// Per-column peak amplitudes for the last sample/width drawn. Scanning the
+// whole sample is the expensive part of this page, and the result only
+// changes when a different sample is loaded or the terminal is resized.
+struct WaveformPeakCache {
+    const int16_t* samples = nullptr;
+    uint32_t sampleCount = 0;
+    int width = 0;
+    std::vector<float> peaks;
+};
+
+WaveformPeakCache waveformPeakCache;
+
+const std::vector<float>& getWaveformPeaks(const SampleData* sample, int width, int samplesPerColumn) {
+    WaveformPeakCache& cache = waveformPeakCache;
+    if (cache.samples == sample->samples && cache.sampleCount == sample->sampleCount && cache.width == width) {
+        return cache.peaks;
+    }
 
-    // Calculate loop region boundaries in columns
-    int loopStartCol = static_cast<int>(loopStart * width);
-    int loopEndCol = static_cast<int>((loopStart + loopLength) * width);
+    cache.samples = sample->samples;
+    cache.sampleCount = sample->sampleCount;
+    cache.width = width;
+    cache.peaks.assign(width, 0.0f);
 
     // For each column, find the peak amplitude
     for (int col = 0; col < width; ++col) {
         int startSample = col * samplesPerColumn;
         int endSample = std::min(startSample + samplesPerColumn, static_cast<int>(sample->sampleCount));
 
-        // Find peak amplitude in this column
         float peakAmplitude = 0.0f;
         for (int i = startSample; i < endSample; ++i) {
             float sampleValue = std::abs(sample->samples[i]) / 32768.0f; // Convert Q15 to float
@@ -35,33 +44,46 @@ void drawSamplerWaveform(int topRow, int leftCol, int height, int width, const S
                 peakAmplitude = sampleValue;
             }
         }
+        cache.peaks[col] = peakAmplitude;
+    }
+
+    return cache.peaks;
+}
+
+void drawSamplerWaveform(int topRow, int leftCol, int height, int width, const SampleData* sample, float loopStart, float loopLength) {
+    if (!sample || sample->sampleCount == 0 || !sample->samples) return;
+
+    // Calculate how many samples to analyze per column
+    const int samplesPerColumn = sample->sampleCount / width;
+    if (samplesPerColumn == 0) return;
+
+    int centerRow = topRow + height / 2;
+
+    // Calculate loop region boundaries in columns
+    int loopStartCol = static_cast<int>(loopStart * width);
+    int loopEndCol = static_cast<int>((loopStart + loopLength) * width);
+
+    const std::vector<float>& peaks = getWaveformPeaks(sample, width, samplesPerColumn);
+
+    // Color: bright green in loop region, dim green outside
+    const int loopAttr = COLOR_PAIR(2) | A_BOLD;
+    const int outsideAttr = COLOR_PAIR(2) | A_DIM;
+
+    for (int col = 0; col < width; ++col) {
+        float peakAmplitude = peaks[col];
 
         // Convert to column height (bipolar display)
         // Use full height/2 for maximum amplitude (don't scale down)
         int columnHeight = static_cast<int>(peakAmplitude * (height / 2));
         columnHeight = std::min(columnHeight, height / 2);
 
-        // Determine color: bright green in loop region, dim green outside
         bool inLoop = (col >= loopStartCol && col < loopEndCol);
-        int colorAttr = inLoop ? (COLOR_PAIR(2) | A_BOLD) : (COLOR_PAIR(2) | A_DIM);
-
-        // Draw above center
-        for (int i = 0; i < columnHeight; ++i) {
-            attron(colorAttr);
-            mvaddch(centerRow - i - 1, leftCol + col, '*');
-            attroff(colorAttr);
-        }
-
-        // Draw below center
-        for (int i = 0; i < columnHeight; ++i) {
-            attron(colorAttr);
-            mvaddch(centerRow + i + 1, leftCol + col, '*');
-            attroff(colorAttr);
-        }
+        int colorAttr = inLoop ? loopAttr : outsideAttr;
 
-        // Always draw center line in green with * characters
+        // The column is symmetric about the center line, so draw it as one
+        // vertical run of '*' (center line included) with a single attribute toggle
         attron(colorAttr);
-        mvaddch(centerRow, leftCol + col, '*');
+        mvvline(centerRow - columnHeight, leftCol + col, '*', 2 * columnHeight + 1);
         attroff(colorAttr);
     }
 }
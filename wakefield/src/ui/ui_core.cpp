@@ -7,6 +7,7 @@ UI::UI(Synth* synth, SynthParameters* params)
     : synth(synth)
     , params(params)
     , initialized(false)
+    , redrawRequested(true)
     , currentPage(UIPage::OSCILLATOR)
     , audioDeviceName("Unknown")
     , audioSampleRate(0)
@@ -73,7 +74,7 @@ UI::UI(Synth* synth, SynthParameters* params)
     initializeParameters();
 
     // Set initial selected parameter to first parameter on main page
-    std::vector<int> initialParams = getParameterIdsForPage(UIPage::OSCILLATOR);
+    const std::vector<int>& initialParams = getParameterIdsForPage(UIPage::OSCILLATOR);
     if (!initialParams.empty()) {
         selectedParameterId = initialParams[0];  // Start with first parameter
     }
@@ -164,6 +165,7 @@ bool UI::update() {
     // Process only the most recent key if any were detected
     if (lastValidKey != ERR) {
         handleInput(lastValidKey);
+        redrawRequested = true;
 
         if (lastValidKey == 'q' || lastValidKey == 'Q') {
             return false;
@@ -180,6 +182,7 @@ bool UI::update() {
             // Timeout - cancel MIDI learn
             finishMidiLearn();
             addConsoleMessage("MIDI Learn timeout - cancelled");
+            redrawRequested = true;
         }
     }
 
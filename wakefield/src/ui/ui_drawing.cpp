@@ -2,45 +2,50 @@
 #include "../sequencer.h"
 #include "ui_utils.h"
 #include <algorithm>
+#include <cstdio>
 #include <string>
 
+namespace {
+
+struct TabInfo {
+    const char* label;  // Padded with a space on each side
+    UIPage page;
+};
+
+const TabInfo kTabs[] = {
+    {" OSC ", UIPage::OSCILLATOR},
+    {" SAMP ", UIPage::SAMPLER},
+    {" MIX ", UIPage::MIXER},
+    {" LFO ", UIPage::LFO},
+    {" ENV ", UIPage::ENV},
+    {" FM ", UIPage::FM},
+    {" MOD ", UIPage::MOD},
+    {" REVERB ", UIPage::REVERB},
+    {" FILTER ", UIPage::FILTER},
+    {" LOOPER ", UIPage::LOOPER},
+    {" SEQUENCER ", UIPage::SEQUENCER},
+    {" CHAOS ", UIPage::CHAOS},
+    {" CONFIG ", UIPage::CONFIG}
+};
+
+} // namespace
+
 void UI::drawTabs() {
     int cols = getmaxx(stdscr);
 
-    struct TabInfo {
-        const char* label;
-        UIPage page;
-    };
-
-    const TabInfo tabs[] = {
-        {"OSC", UIPage::OSCILLATOR},
-        {"SAMP", UIPage::SAMPLER},
-        {"MIX", UIPage::MIXER},
-        {"LFO", UIPage::LFO},
-        {"ENV", UIPage::ENV},
-        {"FM", UIPage::FM},
-        {"MOD", UIPage::MOD},
-        {"REVERB", UIPage::REVERB},
-        {"FILTER", UIPage::FILTER},
-        {"LOOPER", UIPage::LOOPER},
-        {"SEQUENCER", UIPage::SEQUENCER},
-        {"CHAOS", UIPage::CHAOS},
-        {"CONFIG", UIPage::CONFIG}
-    };
-
     int x = 0;
-    const int tabCount = static_cast<int>(sizeof(tabs) / sizeof(tabs[0]));
+    const int tabCount = static_cast<int>(sizeof(kTabs) / sizeof(kTabs[0]));
     for (int i = 0; i < tabCount; ++i) {
-        std::string text = " " + std::string(tabs[i].label) + " ";
-        int textLen = static_cast<int>(text.size());
+        const char* text = kTabs[i].label;
+        int textLen = static_cast<int>(std::char_traits<char>::length(text));
 
-        if (currentPage == tabs[i].page) {
+        if (currentPage == kTabs[i].page) {
             attron(COLOR_PAIR(5) | A_BOLD);
-            mvprintw(0, x, "%s", text.c_str());
+            mvprintw(0, x, "%s", text);
             attroff(COLOR_PAIR(5) | A_BOLD);
         } else {
             attron(COLOR_PAIR(6));
-            mvprintw(0, x, "%s", text.c_str());
+            mvprintw(0, x, "%s", text);
             attroff(COLOR_PAIR(6));
         }
 
@@ -52,8 +57,8 @@ void UI::drawTabs() {
     }
 
     // Fill rest of line
-    for (int i = x; i < cols; ++i) {
-        mvaddch(0, i, ' ');
+    if (x < cols) {
+        mvhline(0, x, ' ', cols - x);
     }
 
     // Draw separator line
@@ -108,19 +113,24 @@ void UI::drawCPUOverlay() {
     mvprintw(0, x, "CPU:");
     attroff(COLOR_PAIR(1));
 
-    // Color code based on usage
-    int colorPair;
-    if (cpuUsage < 50.0f) {
-        colorPair = 2;  // Green - low usage
-    } else if (cpuUsage < 80.0f) {
-        colorPair = 3;  // Yellow - medium usage
-    } else {
-        colorPair = 4;  // Red - high usage
+    // The monitor only samples every 500ms, so reformat only when the value changes
+    if (cpuUsage != cpuOverlayUsage) {
+        cpuOverlayUsage = cpuUsage;
+        std::snprintf(cpuOverlayText, sizeof(cpuOverlayText), "%5.1f%%", cpuUsage);
+
+        // Color code based on usage
+        if (cpuUsage < 50.0f) {
+            cpuOverlayColorPair = 2;  // Green - low usage
+        } else if (cpuUsage < 80.0f) {
+            cpuOverlayColorPair = 3;  // Yellow - medium usage
+        } else {
+            cpuOverlayColorPair = 4;  // Red - high usage
+        }
     }
 
-    attron(COLOR_PAIR(colorPair) | A_BOLD);
-    mvprintw(0, x + 5, "%5.1f%%", cpuUsage);
-    attroff(COLOR_PAIR(colorPair) | A_BOLD);
+    attron(COLOR_PAIR(cpuOverlayColorPair) | A_BOLD);
+    mvaddstr(0, x + 5, cpuOverlayText);
+    attroff(COLOR_PAIR(cpuOverlayColorPair) | A_BOLD);
 }
 
 void UI::drawHotkeyLine() {
@@ -146,6 +156,7 @@ void UI::drawHotkeyLine() {
 }
 
 void UI::draw(int activeVoices) {
+    redrawRequested = false;
     erase();  // Use erase() instead of clear() - doesn't cause flicker
 
     // If help is active, show help instead of normal UI
@@ -223,12 +234,10 @@ void UI::draw(int activeVoices) {
         int startY = (maxY - height) / 2;
         int startX = (maxX - width) / 2;
 
-        // Draw box
+        // Draw box (one run per row)
         attron(COLOR_PAIR(5));
         for (int y = startY; y < startY + height; ++y) {
-            for (int x = startX; x < startX + width; ++x) {
-                mvaddch(y, x, ' ');
-            }
+            mvhline(y, startX, ' ', width);
         }
         attroff(COLOR_PAIR(5));
 
@@ -260,12 +269,10 @@ void UI::draw(int activeVoices) {
         int startY = (maxY - height) / 2;
         int startX = (maxX - width) / 2;
 
-        // Draw box
+        // Draw box (one run per row)
         attron(COLOR_PAIR(5));
         for (int y = startY; y < startY + height; ++y) {
-            for (int x = startX; x < startX + width; ++x) {
-                mvaddch(y, x, ' ');
-            }
+            mvhline(y, startX, ' ', width);
         }
         attroff(COLOR_PAIR(5));
 
@@ -335,9 +342,7 @@ void UI::draw(int activeVoices) {
         int startX = std::max(1, (maxX - width) / 2);
 
         for (int y = startY; y < startY + height; ++y) {
-            for (int x = startX; x < startX + width; ++x) {
-                mvaddch(y, x, ' ');
-            }
+            mvhline(y, startX, ' ', width);
         }
 
         attron(A_BOLD);
@@ -377,9 +382,7 @@ void UI::draw(int activeVoices) {
 
         // Draw background
         for (int y = startY; y < startY + height; ++y) {
-            for (int x = startX; x < startX + width; ++x) {
-                mvaddch(y, x, ' ');
-            }
+            mvhline(y, startX, ' ', width);
         }
 
         // Draw border
@@ -6,12 +6,30 @@
 void UI::showHelp() {
     helpActive = true;
     helpScrollOffset = 0;
+
+    // Split help content into lines once; the page can't change while help is open
+    std::string content = getHelpContent(currentPage);
+    helpLines.clear();
+    std::string line;
+    for (char c : content) {
+        if (c == '\n') {
+            helpLines.push_back(line);
+            line.clear();
+        } else {
+            line += c;
+        }
+    }
+    if (!line.empty()) {
+        helpLines.push_back(line);
+    }
+
     clear();
 }
 
 void UI::hideHelp() {
     helpActive = false;
     helpScrollOffset = 0;
+    helpLines.clear();
     clear();
 }
 
@@ -594,8 +612,8 @@ void UI::drawHelpPage() {
     attroff(COLOR_PAIR(5) | A_BOLD);
 
     attron(COLOR_PAIR(6));
-    for (int i = 6; i < cols; ++i) {
-        mvaddch(0, i, ' ');
+    if (cols > 6) {
+        mvhline(0, 6, ' ', cols - 6);
     }
     attroff(COLOR_PAIR(6));
 
@@ -604,23 +622,7 @@ void UI::drawHelpPage() {
     mvhline(1, 0, '-', cols);
     attroff(COLOR_PAIR(1));
 
-    // Get help content for current page
-    std::string content = getHelpContent(currentPage);
-
-    // Split content into lines
-    std::vector<std::string> lines;
-    std::string line;
-    for (char c : content) {
-        if (c == '\n') {
-            lines.push_back(line);
-            line.clear();
-        } else {
-            line += c;
-        }
-    }
-    if (!line.empty()) {
-        lines.push_back(line);
-    }
+    const std::vector<std::string>& lines = helpLines;
 
     // Draw content with scrolling
     int contentHeight = rows - 4;  // Leave space for header and footer
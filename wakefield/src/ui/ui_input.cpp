@@ -3,11 +3,73 @@
 #include "../loop_manager.h"
 #include "../sequencer.h"
 #include <algorithm>
+#include <array>
 
 // External references to global objects from main.cpp
 extern LoopManager* loopManager;
 extern Sequencer* sequencer;
 
+namespace {
+
+// MIDI keyboard mode layout: key code -> semitone offset from the current
+// octave's C, or -1 for keys that don't play notes.
+// Piano-style layout: ZSXDCVGBHNJM (lower row white keys)
+//                     Q2W3ER5T6Y7U (upper row black keys)
+// Additional: I9O0P (extend range)
+const std::array<signed char, 256> kKeyboardSemitones = [] {
+    struct KeyNote {
+        char key;
+        char shifted;
+        signed char semitone;
+    };
+
+    const KeyNote layout[] = {
+        // Lower row (white keys) - C major scale starting from base note
+        {'z', 'Z', 0},   // C
+        {'s', 'S', 1},   // C#
+        {'x', 'X', 2},   // D
+        {'d', 'D', 3},   // D#
+        {'c', 'C', 4},   // E
+        {'v', 'V', 5},   // F
+        {'g', 'G', 6},   // F#
+        {'b', 'B', 7},   // G
+        {'h', 'H', 8},   // G#
+        {'n', 'N', 9},   // A
+        {'j', 'J', 10},  // A#
+        {'m', 'M', 11},  // B
+        {',', '<', 12},  // C (next octave)
+
+        // Upper row (chromatic) - second octave
+        {'q', 'Q', 12},  // C
+        {'2', '@', 13},  // C#
+        {'w', 'W', 14},  // D
+        {'3', '#', 15},  // D#
+        {'e', 'E', 16},  // E
+        {'r', 'R', 17},  // F
+        {'5', '%', 18},  // F#
+        {'t', 'T', 19},  // G
+        {'6', '^', 20},  // G#
+        {'y', 'Y', 21},  // A
+        {'7', '&', 22},  // A#
+        {'u', 'U', 23},  // B
+        {'i', 'I', 24},  // C (two octaves up)
+        {'9', '(', 25},  // C#
+        {'o', 'O', 26},  // D
+        {'0', ')', 27},  // D#
+        {'p', 'P', 28},  // E
+    };
+
+    std::array<signed char, 256> table;
+    table.fill(-1);
+    for (const KeyNote& entry : layout) {
+        table[static_cast<unsigned char>(entry.key)] = entry.semitone;
+        table[static_cast<unsigned char>(entry.shifted)] = entry.semitone;
+    }
+    return table;
+}();
+
+} // namespace
+
 void UI::handleInput(int ch) {
     // Check for Ctrl+K to toggle MIDI keyboard mode (KEY_CTRL + 'k' = 11 in most terminals)
     if (ch == 11) {  // Ctrl+K
@@ -16,10 +78,12 @@ void UI::handleInput(int ch) {
             addConsoleMessage("MIDI Keyboard Mode: ON (Octave " + std::to_string(midiKeyboardOctave) + ")");
         } else {
             // Release all active notes when exiting keyboard mode
-            for (int note : activeKeyboardNotes) {
-                synth->noteOff(note);
+            for (int note = 0; note < 128; ++note) {
+                if (activeKeyboardNotes.test(note)) {
+                    synth->noteOff(note);
+                }
             }
-            activeKeyboardNotes.clear();
+            activeKeyboardNotes.reset();
             addConsoleMessage("MIDI Keyboard Mode: OFF");
         }
         return;
@@ -27,55 +91,12 @@ void UI::handleInput(int ch) {
 
     // Handle MIDI keyboard mode input (musical typing)
     if (midiKeyboardMode) {
-        // Map of keys to semitone offsets from base note
-        // Piano-style layout: ZSXDCVGBHNJM (lower row white keys)
-        //                     Q2W3ER5T6Y7U (upper row black keys)
-        // Additional: I9O0P (extend range)
-        int semitoneOffset = -1;
-
         switch (ch) {
-            // Lower row (white keys) - C major scale starting from base note
-            case 'z': case 'Z': semitoneOffset = 0; break;   // C
-            case 's': case 'S': semitoneOffset = 1; break;   // C#
-            case 'x': case 'X': semitoneOffset = 2; break;   // D
-            case 'd': case 'D': semitoneOffset = 3; break;   // D#
-            case 'c': case 'C': semitoneOffset = 4; break;   // E
-            case 'v': case 'V': semitoneOffset = 5; break;   // F
-            case 'g': case 'G': semitoneOffset = 6; break;   // F#
-            case 'b': case 'B': semitoneOffset = 7; break;   // G
-            case 'h': case 'H': semitoneOffset = 8; break;   // G#
-            case 'n': case 'N': semitoneOffset = 9; break;   // A
-            case 'j': case 'J': semitoneOffset = 10; break;  // A#
-            case 'm': case 'M': semitoneOffset = 11; break;  // B
-            case ',': case '<': semitoneOffset = 12; break;  // C (next octave)
-
-            // Upper row (chromatic) - second octave
-            case 'q': case 'Q': semitoneOffset = 12; break;  // C
-            case '2': case '@': semitoneOffset = 13; break;  // C#
-            case 'w': case 'W': semitoneOffset = 14; break;  // D
-            case '3': case '#': semitoneOffset = 15; break;  // D#
-            case 'e': case 'E': semitoneOffset = 16; break;  // E
-            case 'r': case 'R': semitoneOffset = 17; break;  // F
-            case '5': case '%': semitoneOffset = 18; break;  // F#
-            case 't': case 'T': semitoneOffset = 19; break;  // G
-            case '6': case '^': semitoneOffset = 20; break;  // G#
-            case 'y': case 'Y': semitoneOffset = 21; break;  // A
-            case '7': case '&': semitoneOffset = 22; break;  // A#
-            case 'u': case 'U': semitoneOffset = 23; break;  // B
-            case 'i': case 'I': semitoneOffset = 24; break;  // C (two octaves up)
-            case '9': case '(': semitoneOffset = 25; break;  // C#
-            case 'o': case 'O': semitoneOffset = 26; break;  // D
-            case '0': case ')': semitoneOffset = 27; break;  // D#
-            case 'p': case 'P': semitoneOffset = 28; break;  // E
-
             // Octave control
             case 'a': case 'A':  // Lower octave
                 midiKeyboardOctave = std::max(0, midiKeyboardOctave - 1);
                 addConsoleMessage("MIDI Keyboard: Octave " + std::to_string(midiKeyboardOctave));
                 return;
-            case 'f': case 'F':  // Raise octave (avoiding conflict with 'f' key note)
-                // Changed to use different key
-                break;
             case '\'': case '"':  // Raise octave (using apostrophe/quote key)
                 midiKeyboardOctave = std::min(10, midiKeyboardOctave + 1);
                 addConsoleMessage("MIDI Keyboard: Octave " + std::to_string(midiKeyboardOctave));
@@ -84,33 +105,30 @@ void UI::handleInput(int ch) {
             // Allow escape to exit MIDI keyboard mode
             case 27:  // ESC
                 midiKeyboardMode = false;
-                for (int note : activeKeyboardNotes) {
-                    synth->noteOff(note);
+                for (int note = 0; note < 128; ++note) {
+                    if (activeKeyboardNotes.test(note)) {
+                        synth->noteOff(note);
+                    }
                 }
-                activeKeyboardNotes.clear();
+                activeKeyboardNotes.reset();
                 addConsoleMessage("MIDI Keyboard Mode: OFF");
                 return;
         }
 
+        // Look up the note key in the layout table
+        int semitoneOffset = (ch >= 0 && ch < static_cast<int>(kKeyboardSemitones.size()))
+                                 ? kKeyboardSemitones[ch]
+                                 : -1;
+
         if (semitoneOffset >= 0) {
             // Calculate MIDI note number (C4 = 60)
             int baseNote = (midiKeyboardOctave * 12) + 12;  // C of current octave
             int midiNote = baseNote + semitoneOffset;
 
-            if (midiNote >= 0 && midiNote <= 127) {
-                // Check if note is already active (avoid retriggering on key repeat)
-                bool alreadyActive = false;
-                for (int activeNote : activeKeyboardNotes) {
-                    if (activeNote == midiNote) {
-                        alreadyActive = true;
-                        break;
-                    }
-                }
-
-                if (!alreadyActive) {
-                    synth->noteOn(midiNote, 100);  // Fixed velocity of 100
-                    activeKeyboardNotes.push_back(midiNote);
-                }
+            // Skip notes that are already active (avoid retriggering on key repeat)
+            if (midiNote >= 0 && midiNote <= 127 && !activeKeyboardNotes.test(midiNote)) {
+                synth->noteOn(midiNote, 100);  // Fixed velocity of 100
+                activeKeyboardNotes.set(midiNote);
             }
         }
 
@@ -198,52 +216,28 @@ void UI::handleInput(int ch) {
     }
 
     // Get current page parameter IDs (for non-sequencer pages)
-    std::vector<int> pageParams;
-    if (currentPage != UIPage::SEQUENCER) {
-        pageParams = getParameterIdsForPage(currentPage);
-    }
+    static const std::vector<int> noPageParams;
+    const std::vector<int>& pageParams = (currentPage != UIPage::SEQUENCER)
+        ? getParameterIdsForPage(currentPage)
+        : noPageParams;
 
     auto setPage = [&](UIPage target) {
         currentPage = target;
-        std::vector<int> newPageParams = getParameterIdsForPage(currentPage);
+        const std::vector<int>& newPageParams = getParameterIdsForPage(currentPage);
         if (!newPageParams.empty()) {
             selectedParameterId = newPageParams[0];
         }
     };
 
-    // Tab key cycles forward through pages
+    // Tab key cycles forward through pages (in UIPage/tab bar order)
     if (ch == '\t') {
-        if (currentPage == UIPage::OSCILLATOR) setPage(UIPage::SAMPLER);
-        else if (currentPage == UIPage::SAMPLER) setPage(UIPage::MIXER);
-        else if (currentPage == UIPage::MIXER) setPage(UIPage::LFO);
-        else if (currentPage == UIPage::LFO) setPage(UIPage::ENV);
-        else if (currentPage == UIPage::ENV) setPage(UIPage::FM);
-        else if (currentPage == UIPage::FM) setPage(UIPage::MOD);
-        else if (currentPage == UIPage::MOD) setPage(UIPage::REVERB);
-        else if (currentPage == UIPage::REVERB) setPage(UIPage::FILTER);
-        else if (currentPage == UIPage::FILTER) setPage(UIPage::LOOPER);
-        else if (currentPage == UIPage::LOOPER) setPage(UIPage::SEQUENCER);
-        else if (currentPage == UIPage::SEQUENCER) setPage(UIPage::CHAOS);
-        else if (currentPage == UIPage::CHAOS) setPage(UIPage::CONFIG);
-        else setPage(UIPage::OSCILLATOR);
+        setPage(static_cast<UIPage>((static_cast<int>(currentPage) + 1) % UI_PAGE_COUNT));
         return;
     }
 
     // Ctrl+Tab (KEY_BTAB or Shift+Tab) cycles backward through pages
     if (ch == KEY_BTAB || ch == 353) {  // KEY_BTAB = Shift+Tab, 353 = some terminals
-        if (currentPage == UIPage::OSCILLATOR) setPage(UIPage::CONFIG);
-        else if (currentPage == UIPage::SAMPLER) setPage(UIPage::OSCILLATOR);
-        else if (currentPage == UIPage::MIXER) setPage(UIPage::SAMPLER);
-        else if (currentPage == UIPage::LFO) setPage(UIPage::MIXER);
-        else if (currentPage == UIPage::ENV) setPage(UIPage::LFO);
-        else if (currentPage == UIPage::FM) setPage(UIPage::ENV);
-        else if (currentPage == UIPage::MOD) setPage(UIPage::FM);
-        else if (currentPage == UIPage::REVERB) setPage(UIPage::MOD);
-        else if (currentPage == UIPage::FILTER) setPage(UIPage::REVERB);
-        else if (currentPage == UIPage::LOOPER) setPage(UIPage::FILTER);
-        else if (currentPage == UIPage::SEQUENCER) setPage(UIPage::LOOPER);
-        else if (currentPage == UIPage::CHAOS) setPage(UIPage::SEQUENCER);
-        else if (currentPage == UIPage::CONFIG) setPage(UIPage::CHAOS);
+        setPage(static_cast<UIPage>((static_cast<int>(currentPage) + UI_PAGE_COUNT - 1) % UI_PAGE_COUNT));
         return;
     }
 
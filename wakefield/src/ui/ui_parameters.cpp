@@ -115,26 +115,33 @@ void UI::initializeParameters() {
     parameters.push_back({351, ParamType::FLOAT, "Clock", "Hz", 0.01f, 1000.0f, {}, true, static_cast<int>(UIPage::CHAOS)});
     parameters.push_back({352, ParamType::ENUM, "Interp", "", 0, 2, {"LINEAR", "CUBIC", "HOLD"}, true, static_cast<int>(UIPage::CHAOS)});
     parameters.push_back({353, ParamType::BOOL, "Running", "", 0, 1, {}, false, static_cast<int>(UIPage::CHAOS)});
+
+    // getParameter() is hit several times per parameter per frame, so index by id once
+    parameterIndexById.clear();
+    parameterIdsByPage.assign(UI_PAGE_COUNT, {});
+    for (size_t i = 0; i < parameters.size(); ++i) {
+        parameterIndexById[parameters[i].id] = i;
+        if (parameters[i].page >= 0 && parameters[i].page < UI_PAGE_COUNT) {
+            parameterIdsByPage[parameters[i].page].push_back(parameters[i].id);
+        }
+    }
 }
 
 InlineParameter* UI::getParameter(int id) {
-    for (auto& param : parameters) {
-        if (param.id == id) {
-            return &param;
-        }
+    auto it = parameterIndexById.find(id);
+    if (it == parameterIndexById.end()) {
+        return nullptr;
     }
-    return nullptr;
+    return &parameters[it->second];
 }
 
-std::vector<int> UI::getParameterIdsForPage(UIPage page) {
-    std::vector<int> ids;
+const std::vector<int>& UI::getParameterIdsForPage(UIPage page) const {
+    static const std::vector<int> noParameters;
     int pageInt = static_cast<int>(page);
-    for (const auto& param : parameters) {
-        if (param.page == pageInt) {
-            ids.push_back(param.id);
-        }
+    if (pageInt < 0 || pageInt >= static_cast<int>(parameterIdsByPage.size())) {
+        return noParameters;
     }
-    return ids;
+    return parameterIdsByPage[pageInt];
 }
 
 float UI::getParameterValue(int id) {